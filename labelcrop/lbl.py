@@ -17,45 +17,58 @@ Modes of operation:
   
   3. Cropping + Rotation Mode:
        labelcrop input.pdf output.pdf angle_clockwise
-     • Crops as above, then rotates each page by the given angle (in degrees, clockwise).
+     • Crops as above and rotates each page by the given angle (in degrees, clockwise) in the same pass.
+       Multiples of 90 set each page's /Rotate; other angles rotate the page content about the
+       centre of the crop rectangle and grow the page to fit. A full turn (0, 360, ...) only crops.
+
+  4. Batch Cropping Mode:
+       labelcrop --batch input1.pdf output1.pdf [input2.pdf output2.pdf ...]
+     • Crops each input PDF into the output PDF that follows it, reading crop_data.cfg only once.
 
 All coordinates are in PDF points.
 """
 
 import sys
 import os
-import json
-import tkinter as tk
-import tkinter.font as tkfont
 import math
-import pymupdf
-from PyPDF2 import PdfReader, PdfWriter
+import contextlib
+import collections
+import functools
+
+# The GUI (tkinter, pymupdf), PDF writing (pikepdf) and crop data (json)
+# dependencies are imported inside the functions that use them, so each mode
+# only loads what it needs and the usage message prints without any of them.
 
 CONFIG_FILE = "crop_data.cfg"
 
 POINTS_PER_INCH = 72.0
 POINTS_PER_CM = POINTS_PER_INCH / 2.54
 
+PREVIEW_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "labelcrop")
+PREVIEW_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Number of preview renders the selector keeps in memory while the window is open.
+RECENT_RENDERS_MAX = 4
+
+# Aspect ratios may be written "2x3", "2:3" or "2/3"; all are normalized to ":".
+ASPECT_SEPARATORS = str.maketrans({"x": ":", "/": ":"})
+# Points per unit for every spelling accepted in the unit field.
+UNIT_POINTS = {
+    "in": POINTS_PER_INCH, "inch": POINTS_PER_INCH, "inches": POINTS_PER_INCH,
+    "cm": POINTS_PER_CM, "centimeter": POINTS_PER_CM, "centimeters": POINTS_PER_CM,
+    "pt": 1.0, "pts": 1.0, "point": 1.0, "points": 1.0,
+    "px": 1.0, "pixel": 1.0, "pixels": 1.0,
+}
+
 def parse_aspect_ratio(text):
     if not text:
         return None
-    value = text.strip().lower()
-    if not value:
-        return None
-    for sep in ("x", ":", "/"):
-        if sep in value:
-            parts = value.split(sep, 1)
-            try:
-                w = float(parts[0])
-                h = float(parts[1])
-            except (ValueError, IndexError):
-                return None
-            return (w / h) if w > 0 and h > 0 else None
+    parts = text.strip().lower().translate(ASPECT_SEPARATORS).split(":", 1)
     try:
-        ratio = float(value)
+        w = float(parts[0])
+        h = float(parts[1]) if len(parts) == 2 else 1.0
     except ValueError:
         return None
-    return ratio if ratio > 0 else None
+    return (w / h) if w > 0 and h > 0 else None
 
 def parse_float(text):
     try:
@@ -66,30 +79,69 @@ def parse_float(text):
 def unit_to_points(value, unit):
     if value is None:
         return None
-    unit_norm = (unit or "").strip().lower()
-    if unit_norm in ("in", "inch", "inches"):
-        return value * POINTS_PER_INCH
-    if unit_norm in ("cm", "centimeter", "centimeters"):
-        return value * POINTS_PER_CM
-    if unit_norm in ("pt", "pts", "point", "points"):
-        return value
-    if unit_norm in ("px", "pixel", "pixels"):
-        return value
-    return None
+    factor = UNIT_POINTS.get((unit or "").strip().lower())
+    return value * factor if factor else None
 
 def points_to_unit(value, unit):
     if value is None:
         return None
-    unit_norm = (unit or "").strip().lower()
-    if unit_norm in ("in", "inch", "inches"):
-        return value / POINTS_PER_INCH
-    if unit_norm in ("cm", "centimeter", "centimeters"):
-        return value / POINTS_PER_CM
-    if unit_norm in ("pt", "pts", "point", "points"):
-        return value
-    if unit_norm in ("px", "pixel", "pixels"):
-        return value
-    return None
+    factor = UNIT_POINTS.get((unit or "").strip().lower())
+    return value / factor if factor else None
+
+### Preview Cache
+def preview_cache_path(pdf_path, scale):
+    import hashlib
+
+    abspath = os.path.abspath(pdf_path)
+    key = hashlib.blake2b(f"{abspath}|{os.path.getmtime(abspath)}|{scale}".encode()).hexdigest()
+    return os.path.join(PREVIEW_CACHE_DIR, f"{key}.pgm")
+
+def read_preview_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Mark as recently used for pruning; a cache we can read but not touch is still usable.
+    with contextlib.suppress(OSError):
+        os.utime(cache_path)
+    return data
+
+def write_preview_cache(cache_path, data):
+    # The cache is only an optimization, so failing to write it is not an error.
+    # Previews show whole labels (names, addresses), so the cache is private to the user.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(PREVIEW_CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(PREVIEW_CACHE_DIR, 0o700)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+        prune_preview_cache()
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+def prune_preview_cache(max_bytes=PREVIEW_CACHE_MAX_BYTES):
+    """
+    Deletes the least recently used previews until the cache fits in max_bytes.
+    """
+    entries = []
+    with os.scandir(PREVIEW_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
 
 ### Interactive Crop Area Selector (GUI)
 def interactive_crop_selector(input_pdf_path):
@@ -98,19 +150,29 @@ def interactive_crop_selector(input_pdf_path):
     Lets you draw a rectangle.
     Computes bottom‑left and top‑right coordinates (in PDF points) and saves them.
     """
+    import tkinter as tk
+    import tkinter.font as tkfont
+    import threading
+    import pymupdf
+
     class PDFLabelSelector:
         def __init__(self, pdf_path):
             self.pdf_path = pdf_path
-            self.doc = pymupdf.open(pdf_path)
-            self.page = self.doc[0]  # use first page
-            self.page_height = self.page.rect.height
+            # Only the page size is kept; the document is reopened when a render is needed.
+            with pymupdf.open(pdf_path) as doc:
+                page_rect = doc[0].rect  # use first page
+            self.page_width = page_rect.width
+            self.page_height = page_rect.height
             self.scale = 0.5  # scale factor for display
+            self.inv_scale = 1.0 / self.scale  # canvas pixels → PDF points
             self.rect_id = None
+            self.image_id = None
             self.rect = None
             self.drag_mode = None
             self.resize_edges = None
             self.drag_start = None
             self.handle_size = 6
+            self.cursor_name = None  # last cursor requested through set_cursor
             self.min_size = 10
             self.aspect_ratio = None
             self.forced_dimensions = None  # (width_pts, height_pts)
@@ -122,6 +184,14 @@ def interactive_crop_selector(input_pdf_path):
             self.image_height = 0
             self.suppress_field_update = False
             self.resize_job = None
+            self.fields_job = None
+            self.last_size = None
+            self.recent_renders = collections.OrderedDict()  # scale → PhotoImage, least recent first
+            self.base_pixmap = None  # page raster that display sizes are resampled from
+            self.base_scale = None
+            self.display_list = None  # page drawing commands, once the page has been rendered twice
+            self.prerender = None  # thread producing the first base raster
+            self.prerender_result = None  # (scale, PGM bytes) once that thread is done
             self.init_gui()
         
         def init_gui(self):
@@ -173,81 +243,203 @@ def interactive_crop_selector(input_pdf_path):
 
             self.canvas = tk.Canvas(self.root, cursor="cross", takefocus=1, highlightthickness=0)
             self.canvas.pack(fill=tk.BOTH, expand=True)
-            self.root.update_idletasks()
-            toolbar_width = self.toolbar.winfo_reqwidth()
-            toolbar_height = self.toolbar.winfo_reqheight()
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            desired_width = min(toolbar_width, screen_width - 80)
-            desired_height = min(720, screen_height - 80)
-            self.root.geometry(f"{desired_width}x{desired_height}")
-            self.render_page()
-            self.create_default_rect()
-            self.update_fields_from_rect()
             self.canvas.bind("<ButtonPress-1>", self.on_button_press)
             self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
             self.canvas.bind("<ButtonRelease-1>", self.on_button_release)
             self.canvas.bind("<Motion>", self.on_mouse_move)
             self.canvas.bind("<Leave>", self.on_mouse_leave)
             self.root.bind("<Configure>", self.on_window_resize)
+            # Everything is built and bound before the one layout pass that sizes the
+            # toolbar; the page is drawn from the event loop once the window is up.
+            self.root.update_idletasks()
+            desired_width = min(self.toolbar.winfo_reqwidth(), self.root.winfo_screenwidth() - 80)
+            desired_height = min(720, self.root.winfo_screenheight() - 80)
+            self.root.geometry(f"{desired_width}x{desired_height}")
+            self.start_prerender(desired_width, desired_height)
+            self.root.after(0, self.show_first_page)
             self.root.mainloop()
         
+        def start_prerender(self, window_width, window_height):
+            # Rasterizing the page is the slowest part of startup, so it runs on a
+            # worker thread while Tk shows the window. The thread only produces
+            # bytes; every Tk and Pixmap object is made on the main thread.
+            # The raster is capped at 1.5x (108 dpi): a preview for placing a rectangle
+            # gains nothing from more, and the raster grows with the square of the scale.
+            # It is never smaller than the initial window needs, though, or the first
+            # render would have to throw it away and rasterize again.
+            window_scale = math.floor(min(window_width / self.page_width, window_height / self.page_height) * 100) / 100
+            scale = max(min(self.screen_fit_scale(), 1.5), window_scale)
+            self.prerender = threading.Thread(target=self.prerender_base, args=(scale,), daemon=True)
+            self.prerender.start()
+
+        def prerender_base(self, scale):
+            self.prerender_result = (scale, self.read_base_raster(scale))
+
+        def finish_prerender(self):
+            self.prerender.join()
+            self.prerender = None
+            if self.prerender_result:
+                scale, data = self.prerender_result
+                self.prerender_result = None
+                self.base_pixmap = pymupdf.Pixmap(data)
+                self.base_scale = scale
+
+        def show_first_page(self):
+            if self.prerender and self.prerender.is_alive():
+                self.root.after(20, self.show_first_page)
+                return
+            self.last_size = (self.root.winfo_width(), self.root.winfo_height())
+            self.render_page()
+            self.create_default_rect()
+            self.update_fields_from_rect()
+
         def render_page(self):
             canvas_width = max(self.canvas.winfo_width(), 1)
             canvas_height = max(self.canvas.winfo_height(), 1)
-            page_width = self.page.rect.width
-            page_height = self.page.rect.height
-            scale_x = canvas_width / page_width
-            scale_y = canvas_height / page_height
-            self.scale = min(scale_x, scale_y)
-            matrix = pymupdf.Matrix(self.scale, self.scale)
-            pix = self.page.get_pixmap(matrix=matrix)
-            self.tk_img = tk.PhotoImage(data=pix.tobytes("ppm"))
+            scale_x = canvas_width / self.page_width
+            scale_y = canvas_height / self.page_height
+            # Round the scale down to a 0.01 step so small size changes reuse a cached
+            # render; rounding down keeps the page inside the canvas.
+            self.scale = max(math.floor(min(scale_x, scale_y) * 100) / 100, 0.01)
+            self.inv_scale = 1.0 / self.scale
+            # Cache the decoded Tk images rather than their PGM bytes, so going back to
+            # a recent size hands Tk an image it already holds instead of parsing it again.
+            tk_img = self.recent_renders.get(self.scale)
+            if tk_img is not None:
+                self.recent_renders.move_to_end(self.scale)
+            else:
+                tk_img = tk.PhotoImage(data=self.resample_base_pixmap(self.scale))
+                self.recent_renders[self.scale] = tk_img
+                if len(self.recent_renders) > RECENT_RENDERS_MAX:
+                    self.recent_renders.popitem(last=False)
+            self.tk_img = tk_img
             self.canvas_width = canvas_width
             self.canvas_height = canvas_height
-            self.image_width = page_width * self.scale
-            self.image_height = page_height * self.scale
+            self.image_width = self.page_width * self.scale
+            self.image_height = self.page_height * self.scale
             self.image_x0 = (self.canvas_width - self.image_width) / 2
             self.image_y0 = (self.canvas_height - self.image_height) / 2
-            self.canvas.delete("page")
-            self.canvas.create_image(
+            # Reuse the canvas image item across renders; only its image and position change.
+            if self.image_id:
+                self.canvas.itemconfigure(self.image_id, image=self.tk_img)
+                self.canvas.coords(self.image_id, self.canvas_width / 2, self.canvas_height / 2)
+                return
+            self.image_id = self.canvas.create_image(
                 self.canvas_width / 2,
                 self.canvas_height / 2,
                 anchor=tk.CENTER,
                 image=self.tk_img,
                 tags="page",
             )
-            self.canvas.tag_lower("page")
-            if self.rect_id:
-                self.canvas.tag_raise(self.rect_id)
+            self.canvas.tag_lower(self.image_id)
+
+        def resample_base_pixmap(self, scale):
+            # MuPDF renders the page once, at a scale large enough for the screen, and
+            # each display size is a resample of that raster rather than a new render.
+            # Only a window larger than the base raster triggers another render.
+            # A render needed before the startup thread is done waits for its raster.
+            if self.prerender:
+                self.finish_prerender()
+            if self.base_pixmap is None:
+                self.load_base_pixmap(max(scale, min(self.screen_fit_scale(), 1.5)))
+            elif scale > self.base_scale:
+                # The window has outgrown the startup raster, so render once at the
+                # scale that fits the whole screen rather than again on every enlargement.
+                self.load_base_pixmap(max(scale, self.screen_fit_scale()))
+            if scale == self.base_scale:
+                return self.base_pixmap.tobytes("pgm")
+            width = max(round(self.page_width * scale), 1)
+            height = max(round(self.page_height * scale), 1)
+            pix = pymupdf.Pixmap(self.base_pixmap, width, height)
+            data = pix.tobytes("pgm")
+            pix = None
+            return data
+
+        def screen_fit_scale(self):
+            screen_scale = min(
+                self.root.winfo_screenwidth() / self.page_width,
+                self.root.winfo_screenheight() / self.page_height,
+            )
+            return math.floor(screen_scale * 100) / 100
+
+        def load_base_pixmap(self, scale):
+            self.base_pixmap = pymupdf.Pixmap(self.read_base_raster(scale))
+            self.base_scale = scale
+
+        def read_base_raster(self, scale):
+            cache_path = preview_cache_path(self.pdf_path, scale)
+            data = read_preview_cache(cache_path)
+            if data is None:
+                data = self.rasterize_page(scale)
+                write_preview_cache(cache_path, data)
+            return data
+
+        def rasterize_page(self, scale):
+            # Keep the document open only while rendering, so MuPDF's store can
+            # release the page's fonts and images instead of holding them for the
+            # lifetime of the window.
+            # The preview is only for placing the rectangle, so it is rendered in
+            # greyscale: one byte per pixel instead of three through tobytes and Tk.
+            matrix = pymupdf.Matrix(scale, scale)
+            # A window that has outgrown one base raster is likely to outgrow the next,
+            # so from the second raster on the page's drawing commands are kept in a
+            # display list and later renders skip reopening and reparsing the page.
+            if self.display_list is None and self.base_scale is not None:
+                with pymupdf.open(self.pdf_path) as doc:
+                    self.display_list = doc[0].get_displaylist()
+            if self.display_list is not None:
+                pix = self.display_list.get_pixmap(matrix=matrix, colorspace=pymupdf.csGRAY, alpha=False)
+                data = pix.tobytes("pgm")
+                pix = None
+                return data
+            with pymupdf.open(self.pdf_path) as doc:
+                pix = doc[0].get_pixmap(matrix=matrix, colorspace=pymupdf.csGRAY, alpha=False)
+                data = pix.tobytes("pgm")
+                pix = None
+            pymupdf.TOOLS.store_shrink(100)
+            return data
 
         def on_window_resize(self, event):
+            # <Configure> on the root also fires for every child widget, and again for
+            # moves that don't change the size; only real window resizes need a re-render.
+            # Resizes during a drag are ignored so they don't fight it; on_button_release
+            # re-renders afterwards if the window size changed in the meantime.
+            if event.widget is not self.root or self.drag_mode:
+                return
+            if (event.width, event.height) == self.last_size:
+                return
             if self.resize_job:
                 self.root.after_cancel(self.resize_job)
-            self.resize_job = self.root.after(150, self.on_resize_commit)
+            self.resize_job = self.root.after(300, self.on_resize_commit)
 
         def on_resize_commit(self):
             self.resize_job = None
-            previous_scale = self.scale
-            if not previous_scale:
-                previous_scale = 1.0
-            prev_image_x0 = self.image_x0
-            prev_image_y0 = self.image_y0
+            self.last_size = (self.root.winfo_width(), self.root.winfo_height())
+            # Keep the selection on the same part of the page across the re-render.
+            page_rect = self.rect_to_page(self.rect) if self.rect else None
             self.render_page()
-            if not self.rect:
+            if not page_rect:
                 return
-            x1, y1, x2, y2 = self.rect
-            x1p = (x1 - prev_image_x0) / previous_scale
-            x2p = (x2 - prev_image_x0) / previous_scale
-            y1p = (y1 - prev_image_y0) / previous_scale
-            y2p = (y2 - prev_image_y0) / previous_scale
-            x1 = self.image_x0 + (x1p * self.scale)
-            x2 = self.image_x0 + (x2p * self.scale)
-            y1 = self.image_y0 + (y1p * self.scale)
-            y2 = self.image_y0 + (y2p * self.scale)
+            x1, y1, x2, y2 = self.rect_from_page(page_rect)
             x1, y1, x2, y2 = self.clamp_rect(x1, y1, x2, y2, keep_size=True)
             self.update_rect(x1, y1, x2, y2)
 
+        def rect_to_page(self, rect):
+            # Canvas pixels → page points, measured from the page's top-left corner.
+            x1, y1, x2, y2 = rect
+            x0 = self.image_x0
+            y0 = self.image_y0
+            inv_scale = self.inv_scale
+            return ((x1 - x0) * inv_scale, (y1 - y0) * inv_scale, (x2 - x0) * inv_scale, (y2 - y0) * inv_scale)
+
+        def rect_from_page(self, page_rect):
+            # Page points (top-left origin) → canvas pixels.
+            x1, y1, x2, y2 = page_rect
+            x0 = self.image_x0
+            y0 = self.image_y0
+            scale = self.scale
+            return (x0 + x1 * scale, y0 + y1 * scale, x0 + x2 * scale, y0 + y2 * scale)
+
         def create_default_rect(self):
             default_w = 4 * POINTS_PER_INCH * self.scale
             default_h = 6 * POINTS_PER_INCH * self.scale
@@ -363,17 +555,32 @@ def interactive_crop_selector(input_pdf_path):
             self.update_rect(x1, y1, x2, y2)
 
         def update_rect(self, x1, y1, x2, y2):
+            self.move_rect(x1, y1, x2, y2)
+            self.update_fields_from_rect()
+
+        def move_rect(self, x1, y1, x2, y2):
             self.rect = (x1, y1, x2, y2)
             if self.rect_id:
                 self.canvas.coords(self.rect_id, x1, y1, x2, y2)
+
+        def schedule_field_update(self):
+            # Motion events arrive far faster than the fields need refreshing, and each
+            # StringVar.set redraws its entry, so drags refresh them at most every 50 ms.
+            if not self.fields_job:
+                self.fields_job = self.root.after(50, self.flush_field_update)
+
+        def flush_field_update(self):
+            if self.fields_job:
+                self.root.after_cancel(self.fields_job)
+                self.fields_job = None
             self.update_fields_from_rect()
 
         def update_fields_from_rect(self):
             if not self.rect or self.suppress_field_update:
                 return
             x1, y1, x2, y2 = self.rect
-            width_pts = abs(x2 - x1) / self.scale
-            height_pts = abs(y2 - y1) / self.scale
+            width_pts = abs(x2 - x1) * self.inv_scale
+            height_pts = abs(y2 - y1) * self.inv_scale
             ratio = width_pts / height_pts if height_pts else 0
             self.suppress_field_update = True
             try:
@@ -391,22 +598,26 @@ def interactive_crop_selector(input_pdf_path):
                 self.suppress_field_update = False
 
         def clamp_rect(self, x1, y1, x2, y2, keep_size=False):
-            left_bound = self.image_x0
-            right_bound = self.image_x0 + self.image_width
-            top_bound = self.image_y0
-            bottom_bound = self.image_y0 + self.image_height
+            # Called on every drag event: read the bounds into locals once and clamp
+            # with conditional expressions rather than nested min/max calls.
+            left = self.image_x0
+            top = self.image_y0
+            right = left + self.image_width
+            bottom = top + self.image_height
             if keep_size:
                 w = x2 - x1
                 h = y2 - y1
-                x1 = min(max(x1, left_bound), right_bound - w)
-                y1 = min(max(y1, top_bound), bottom_bound - h)
-                x2 = x1 + w
-                y2 = y1 + h
-                return x1, y1, x2, y2
-            x1 = max(left_bound, min(x1, right_bound))
-            x2 = max(left_bound, min(x2, right_bound))
-            y1 = max(top_bound, min(y1, bottom_bound))
-            y2 = max(top_bound, min(y2, bottom_bound))
+                max_x1 = right - w
+                max_y1 = bottom - h
+                x1 = left if x1 < left else x1
+                x1 = max_x1 if x1 > max_x1 else x1
+                y1 = top if y1 < top else y1
+                y1 = max_y1 if y1 > max_y1 else y1
+                return x1, y1, x1 + w, y1 + h
+            x1 = left if x1 < left else (right if x1 > right else x1)
+            x2 = left if x2 < left else (right if x2 > right else x2)
+            y1 = top if y1 < top else (bottom if y1 > bottom else y1)
+            y2 = top if y2 < top else (bottom if y2 > bottom else y2)
             return x1, y1, x2, y2
 
         def is_inside_rect(self, x, y):
@@ -461,19 +672,25 @@ def interactive_crop_selector(input_pdf_path):
                 y1 += dy
                 y2 += dy
                 x1, y1, x2, y2 = self.clamp_rect(x1, y1, x2, y2, keep_size=True)
-                self.update_rect(x1, y1, x2, y2)
+                self.move_rect(x1, y1, x2, y2)
+                self.schedule_field_update()
                 self.drag_start = (event.x, event.y)
                 return
 
             if self.drag_mode == "resize":
                 x1, y1, x2, y2 = self.resize_rect(x1, y1, x2, y2, event.x, event.y)
-                self.update_rect(x1, y1, x2, y2)
+                self.move_rect(x1, y1, x2, y2)
+                self.schedule_field_update()
                 self.drag_start = (event.x, event.y)
 
         def on_button_release(self, event):
+            was_dragging = self.drag_mode is not None
             self.drag_mode = None
             self.resize_edges = None
             self.drag_start = None
+            self.flush_field_update()
+            if was_dragging and not self.resize_job and (self.root.winfo_width(), self.root.winfo_height()) != self.last_size:
+                self.resize_job = self.root.after(300, self.on_resize_commit)
             self.update_cursor(event.x, event.y)
 
         def on_mouse_move(self, event):
@@ -493,7 +710,10 @@ def interactive_crop_selector(input_pdf_path):
                 cursor_name, fallbacks = self.cursor_for_edges(self.resize_edges)
                 self.set_cursor(cursor_name, fallbacks=fallbacks)
                 return
-            if not self.is_inside_rect(x, y):
+            # Most motion events are away from the selection; reject those with one
+            # bounds test before looking for edges.
+            x1, y1, x2, y2 = self.rect
+            if x < x1 or x > x2 or y < y1 or y > y2:
                 self.set_cursor("arrow")
                 return
             edges = self.get_resize_edges(x, y)
@@ -519,6 +739,11 @@ def interactive_crop_selector(input_pdf_path):
             return "cross", []
 
         def set_cursor(self, cursor_name, fallbacks=None):
+            # Reconfiguring the canvas on every motion event is wasted work when the
+            # cursor is already the one requested.
+            if cursor_name == self.cursor_name:
+                return
+            self.cursor_name = cursor_name
             choices = [cursor_name]
             if fallbacks:
                 choices.extend(fallbacks)
@@ -606,17 +831,19 @@ def interactive_crop_selector(input_pdf_path):
             return x1, y1, x2, y2
 
         def save_and_close(self):
+            import json
+
             if not self.rect:
                 return
-            x1, y1, x2, y2 = self.rect
             # Convert canvas coordinates to PDF coordinates.
             # Canvas x is same direction as PDF x: pdf_x = canvas_x/scale.
             # Canvas y is top-down; PDF y is bottom-up:
             #    pdf_y = page_height - (canvas_y/scale)
-            pdf_x1 = (x1 - self.image_x0) / self.scale
-            pdf_y1 = self.page_height - ((y2 - self.image_y0) / self.scale)  # bottom
-            pdf_x2 = (x2 - self.image_x0) / self.scale
-            pdf_y2 = self.page_height - ((y1 - self.image_y0) / self.scale)  # top
+            left, top, right, bottom = self.rect_to_page(self.rect)
+            pdf_x1 = left
+            pdf_y1 = self.page_height - bottom
+            pdf_x2 = right
+            pdf_y2 = self.page_height - top
             crop_data = {
                 "bottom_left": {"x": pdf_x1, "y": pdf_y1},
                 "top_right": {"x": pdf_x2, "y": pdf_y2}
@@ -633,47 +860,195 @@ def interactive_crop_selector(input_pdf_path):
     PDFLabelSelector(input_pdf_path)
 
 ### Cropping Function
-def crop_pdf(input_pdf, output_pdf, crop_data, quiet=False):
+def rotation_transform(box_coords, angle):
+    """
+    /Rotate only accepts multiples of 90, so other angles are applied to the
+    page content instead. Returns the content-stream prefix that clips to
+    box_coords and rotates it clockwise by 'angle' about its centre, and the
+    box that bounds the rotated rectangle.
+    """
+    x1, y1, x2, y2 = box_coords
+    width = x2 - x1
+    height = y2 - y1
+    cx = (x1 + x2) / 2
+    cy = (y1 + y2) / 2
+    theta = math.radians(angle)
+    cos = math.cos(theta)
+    sin = math.sin(theta)
+    # T(cx, cy) · R(-theta) · T(-cx, -cy) as a PDF matrix [a b c d e f].
+    a, b, c, d = cos, -sin, sin, cos
+    e = cx - (a * cx + c * cy)
+    f = cy - (b * cx + d * cy)
+    # The clip is set after cm, so it is rotated along with the content.
+    prefix = (
+        f"q {a:.6f} {b:.6f} {c:.6f} {d:.6f} {e:.6f} {f:.6f} cm "
+        f"{x1:.6f} {y1:.6f} {width:.6f} {height:.6f} re W n\n"
+    ).encode()
+    half_width = (abs(width * cos) + abs(height * sin)) / 2
+    half_height = (abs(width * sin) + abs(height * cos)) / 2
+    return prefix, (cx - half_width, cy - half_height, cx + half_width, cy + half_height)
+
+def crop_pages(pdf, box_coords, angle=None, content_prefix=None):
+    """
+    Sets MediaBox/CropBox (and /Rotate, if angle is given) on every page of a
+    pikepdf Pdf. If content_prefix is given, each page's content is wrapped in
+    it and a closing Q instead (see rotation_transform).
+    """
+    import pikepdf
+
+    box = pikepdf.Array(box_coords)
+    prefix = suffix = None
+    if content_prefix is not None:
+        # Every page gets the same wrapper, so store each stream once and
+        # reference it from all pages instead of adding two new streams per page.
+        prefix = pdf.make_indirect(pikepdf.Stream(pdf, content_prefix))
+        suffix = pdf.make_indirect(pikepdf.Stream(pdf, b"\nQ\n"))
+    for page in pdf.pages:
+        page.MediaBox = box
+        page.CropBox = box
+        if angle is not None:
+            # Viewers apply /Rotate at display time, so for 90 and 270 the page is
+            # shown with width and height swapped; the boxes themselves stay as cropped.
+            page.Rotate = (int(page.get("/Rotate", 0)) + angle) % 360
+        if prefix is not None:
+            page.contents_add(prefix, prepend=True)
+            page.contents_add(suffix)
+
+def crop_pdf(input_pdf, output_pdf, crop_data, angle=None, quiet=False):
     """
     Crops each page of input_pdf to the rectangle defined in crop_data
     and saves the result to output_pdf.
     crop_data is a dict with keys:
        bottom_left: {x, y}
        top_right: {x, y}
+    If angle is given, each page is also rotated by 'angle' (clockwise)
+    in the same pass, so the output is only written once.
+    Multiples of 90 only update each page's /Rotate entry. Any other angle
+    falls through to the general path in rotation_transform, which rewrites
+    the page content and boxes.
     """
+    import pikepdf
+
+    if angle is not None and angle % 360 == 0:
+        angle = None
     crop_x = crop_data["bottom_left"]["x"]
     crop_y = crop_data["bottom_left"]["y"]
     crop_width = crop_data["top_right"]["x"] - crop_x
     crop_height = crop_data["top_right"]["y"] - crop_y
-    reader = PdfReader(input_pdf)
-    writer = PdfWriter()
-    for page in reader.pages:
-        # Set MediaBox and CropBox exactly as in the saved data.
-        page.mediabox.lower_left = (crop_x, crop_y)
-        page.mediabox.upper_right = (crop_x + crop_width, crop_y + crop_height)
-        page.cropbox.lower_left = (crop_x, crop_y)
-        page.cropbox.upper_right = (crop_x + crop_width, crop_y + crop_height)
-        writer.add_page(page)
-    with open(output_pdf, "wb") as f:
-        writer.write(f)
+    # Every page gets the same box, so build it once and share it across pages.
+    box_coords = (crop_x, crop_y, crop_x + crop_width, crop_y + crop_height)
+    # pikepdf only touches the page dictionaries; content streams are copied through untouched
+    # (apart from the rotation wrapper for angles that aren't a multiple of 90).
+    content_prefix = None
+    if angle is not None and angle % 90 != 0:
+        content_prefix, box_coords = rotation_transform(box_coords, angle)
+        angle = None
+    # input_pdf and output_pdf may be the same file; pikepdf then reads the input
+    # fully into memory before save replaces it.
+    with pikepdf.open(input_pdf, allow_overwriting_input=True) as pdf:
+        crop_pages(pdf, box_coords, angle, content_prefix)
+        # Write streams back with their original filters instead of decoding and recompressing them.
+        pdf.save(
+            output_pdf,
+            linearize=False,
+            object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+            stream_decode_level=pikepdf.StreamDecodeLevel.none,
+        )
     if not quiet:
         print(f"Cropped PDF saved to {output_pdf}")
 
-### Rotation Function
-def rotate_pdf(pdf_path, angle, quiet=False):
+### Crop Data
+def load_crop_data(config_path=CONFIG_FILE):
     """
-    Reopens the PDF at pdf_path, rotates each page by 'angle' (clockwise),
-    and overwrites the file.
+    Returns the crop data saved in config_path, or None if it doesn't exist.
+    The parsed data is reused until the file is modified.
     """
-    reader = PdfReader(pdf_path)
-    writer = PdfWriter()
-    for page in reader.pages:
-        rotated_page = page.rotate(angle)
-        writer.add_page(rotated_page)
-    with open(pdf_path, "wb") as f:
-        writer.write(f)
-    if not quiet:
-        print(f"Rotated PDF saved to {pdf_path}")
+    if not os.path.exists(config_path):
+        return None
+    return read_crop_data(os.path.abspath(config_path), os.path.getmtime(config_path))
+
+@functools.lru_cache(maxsize=8)
+def read_crop_data(config_path, mtime):
+    with open(config_path, "rb") as f:
+        data = f.read()
+    # orjson is optional; the stdlib parser reads the same file.
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads(data)
+    return orjson.loads(data)
+
+def validate_crop_data(crop_data):
+    """
+    Raises ValueError if crop_data is not a usable crop rectangle.
+    """
+    try:
+        x1 = crop_data["bottom_left"]["x"]
+        y1 = crop_data["bottom_left"]["y"]
+        x2 = crop_data["top_right"]["x"]
+        y2 = crop_data["top_right"]["y"]
+    except (TypeError, KeyError):
+        raise ValueError(f"{CONFIG_FILE} must contain bottom_left and top_right points with x and y.")
+    for value in (x1, y1, x2, y2):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Coordinates in {CONFIG_FILE} must be numbers.")
+    if x1 >= x2 or y1 >= y2:
+        raise ValueError(f"The top_right point in {CONFIG_FILE} must be above and to the right of bottom_left.")
+
+def require_crop_data():
+    try:
+        crop_data = load_crop_data()
+    except ValueError as e:
+        print(f"Could not parse {CONFIG_FILE}: {e}")
+        sys.exit(1)
+    if crop_data is None:
+        print("Crop data not found. Run the script with only the input PDF to define the crop box.")
+        sys.exit(1)
+    try:
+        validate_crop_data(crop_data)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    return crop_data
+
+def parse_angle(text):
+    """
+    Returns the clockwise rotation angle given on the command line, reduced mod 360.
+    Raises ValueError if it can't be applied.
+    """
+    try:
+        angle = int(text)
+    except ValueError:
+        raise ValueError("Rotation angle must be an integer (e.g., 90).")
+    return angle % 360
+
+def require_input_pdf(input_pdf):
+    if not os.path.isfile(input_pdf):
+        print(f"Input PDF not found: {input_pdf}")
+        sys.exit(1)
+
+def process_one(input_pdf, output_pdf, crop_data, angle=0):
+    """
+    Crops input_pdf into output_pdf, rotating by 'angle' (clockwise) if it is non-zero.
+    """
+    if angle:
+        crop_pdf(input_pdf, output_pdf, crop_data, angle=angle, quiet=True)
+        print(f"Cropped and rotated PDF saved to {output_pdf}")
+    else:
+        crop_pdf(input_pdf, output_pdf, crop_data)
+
+def print_usage():
+    print("Usage:")
+    print("  To define crop box interactively:")
+    print("      labelcrop input.pdf")
+    print("  To crop using saved crop box:")
+    print("      labelcrop input.pdf output.pdf")
+    print("  To crop and rotate:")
+    print("      labelcrop input.pdf output.pdf angle_clockwise")
+    print("  To crop several PDFs using saved crop box:")
+    print("      labelcrop --batch input1.pdf output1.pdf [input2.pdf output2.pdf ...]")
 
 ### Main Routine
 def main():
@@ -681,37 +1056,38 @@ def main():
     # 1 argument: input.pdf → interactive crop box definition.
     # 2 arguments: input.pdf output.pdf → crop using saved crop data.
     # 3 arguments: input.pdf output.pdf angle_clockwise → crop then rotate.
-    if len(sys.argv) == 2:
+    # --batch input1.pdf output1.pdf [input2.pdf output2.pdf ...] → crop several PDFs with the same crop data.
+    if len(sys.argv) >= 2 and sys.argv[1] == "--batch":
+        paths = sys.argv[2:]
+        if not paths or len(paths) % 2 != 0:
+            print_usage()
+            sys.exit(1)
+        for input_pdf in paths[0::2]:
+            require_input_pdf(input_pdf)
+        crop_data = require_crop_data()
+        for input_pdf, output_pdf in zip(paths[0::2], paths[1::2]):
+            process_one(input_pdf, output_pdf, crop_data)
+    elif len(sys.argv) == 2:
         input_pdf = sys.argv[1]
+        # Check the path before starting Tk, so a typo doesn't cost a GUI startup.
+        require_input_pdf(input_pdf)
         interactive_crop_selector(input_pdf)
     elif len(sys.argv) == 3 or len(sys.argv) == 4:
         input_pdf = sys.argv[1]
         output_pdf = sys.argv[2]
-        # Load crop data from config file.
-        if not os.path.exists(CONFIG_FILE):
-            print("Crop data not found. Run the script with only the input PDF to define the crop box.")
-            sys.exit(1)
-        with open(CONFIG_FILE, "r") as f:
-            crop_data = json.load(f)
+        require_input_pdf(input_pdf)
+        # Validate everything before any PDF is opened, so bad input fails fast.
+        angle = 0
         if len(sys.argv) == 4:
             try:
-                angle = int(sys.argv[3])
-            except ValueError:
-                print("Rotation angle must be an integer (e.g., 90).")
+                angle = parse_angle(sys.argv[3])
+            except ValueError as e:
+                print(e)
                 sys.exit(1)
-            crop_pdf(input_pdf, output_pdf, crop_data, quiet=True)
-            rotate_pdf(output_pdf, angle, quiet=True)
-            print(f"Cropped and rotated PDF saved to {output_pdf}")
-        else:
-            crop_pdf(input_pdf, output_pdf, crop_data)
+        crop_data = require_crop_data()
+        process_one(input_pdf, output_pdf, crop_data, angle)
     else:
-        print("Usage:")
-        print("  To define crop box interactively:")
-        print("      labelcrop input.pdf")
-        print("  To crop using saved crop box:")
-        print("      labelcrop input.pdf output.pdf")
-        print("  To crop and rotate:")
-        print("      labelcrop input.pdf output.pdf angle_clockwise")
+        print_usage()
         sys.exit(1)
 
 if __name__ == '__main__':